@@ -19,6 +19,7 @@ from homeassistant.core import HomeAssistant, ServiceCall
 import voluptuous as vol
 
 from . import const, helpers
+from .calendar import EntitiesCalendarData
 from .const import LOGGER
 
 PLATFORMS: list[str] = [const.SENSOR_PLATFORM]
@@ -32,8 +33,12 @@ valid_person_ids = {}
 
 async def get_person_ids(hass: HomeAssistant):
     """Return a dictionary of valid person entity IDs and their names."""
-    persons = hass.states.async_all('person')  # Fetch all entities in the 'person' domain
-    return {person.entity_id: person.name for person in persons}
+    states = hass.states
+    return {
+        entity_id: person.name
+        for entity_id in states.async_entity_ids('person')
+        if (person := states.get(entity_id)) is not None
+    }
 
 async def refresh_valid_person_ids(hass: HomeAssistant):
     """Refresh the valid person IDs from Home Assistant."""
@@ -190,18 +195,20 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     async def handle_update_state(call: ServiceCall) -> None:
         """Handle the update_state service call."""
         entity_ids = call.data.get(CONF_ENTITY_ID, [])
+        now = helpers.now()
         for entity_id in entity_ids:
             LOGGER.debug("called update_state for %s", entity_id)
             try:
                 entity = hass.data[const.DOMAIN][const.SENSOR_PLATFORM][entity_id]
-                entity.update_state()
+                entity.update_state(now)
             except KeyError as err:
                 LOGGER.error("Failed updating state for %s - %s", entity_id, err)
 
     async def handle_complete_chore(call: ServiceCall) -> None:
         """Handle the complete_chore service call."""
         entity_ids = call.data.get(CONF_ENTITY_ID, [])
-        last_completed = call.data.get(const.ATTR_LAST_COMPLETED, helpers.now())
+        now = helpers.now()
+        last_completed = call.data.get(const.ATTR_LAST_COMPLETED, now)
         completing_user = call.data.get(const.CONF_USER, None)  # Get the user from the call data
 
         for entity_id in entity_ids:
@@ -218,7 +225,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
                 entity.last_completed = dt_util.as_local(last_completed)
                 entity.assigned_user = completing_user  # Assign the user to the chore
-                entity.update_state()
+                entity.update_state(now)
             except KeyError as err:
                 LOGGER.error(
                     "Failed setting last completed for %s - %s", entity_id, err
@@ -262,10 +269,22 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     )
     config_entry.add_update_listener(update_listener)
 
-    # Add sensor
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    # Add sensor, and the shared chore calendar with the first visible chore
+    await hass.config_entries.async_forward_entry_setups(
+        config_entry, [*PLATFORMS, *_calendar_platforms(hass, config_entry)]
+    )
     return True
 
+def _calendar_platforms(hass: HomeAssistant, config_entry: ConfigEntry) -> list[str]:
+    """Return the calendar platform if this is the first chore shown on it."""
+    domain_data = hass.data.setdefault(const.DOMAIN, {})
+    if config_entry.options.get(ATTR_HIDDEN, False) or const.CALENDAR_PLATFORM in domain_data:
+        return []
+    # Claimed before any await, so chores loading together create one calendar
+    domain_data[const.CALENDAR_PLATFORM] = EntitiesCalendarData(hass)
+    LOGGER.debug("Creating chore calendar")
+    return [const.CALENDAR_PLATFORM]
+
 async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Handle removal of an entry."""
     try:
@@ -280,6 +299,9 @@ async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update listener - to re-create device after options update."""
     await refresh_valid_person_ids(hass)  # Refresh person IDs on update
     await hass.config_entries.async_forward_entry_unload(entry, const.SENSOR_PLATFORM)
+    # A chore that is no longer hidden may be the first one on the calendar
     hass.async_add_job(
-        hass.config_entries.async_forward_entry_setup(entry, const.SENSOR_PLATFORM)
+        hass.config_entries.async_forward_entry_setups(
+            entry, [const.SENSOR_PLATFORM, *_calendar_platforms(hass, entry)]
+        )
     )
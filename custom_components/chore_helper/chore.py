@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+import logging
 from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -15,14 +16,46 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 from . import const, helpers
 from .const import LOGGER
-from .calendar import EntitiesCalendarData
 
-PLATFORMS: list[str] = [const.CALENDAR_PLATFORM]
+_MONTH_INDEX: dict[str, int] = {
+    m["value"]: i + 1 for i, m in enumerate(const.MONTH_OPTIONS)
+}
 
 
 class Chore(RestoreEntity):
     """Chore Sensor class."""
 
+    # Entity's own _attr_* attributes are managed by its metaclass and stay
+    # out of the slots.
+    __slots__ = (
+        "config_entry",
+        "_hidden",
+        "_manual",
+        "_first_month",
+        "_last_month",
+        "_icon_normal",
+        "_icon_today",
+        "_icon_tomorrow",
+        "_icon_overdue",
+        "_date_format",
+        "_forecast_dates",
+        "show_overdue_today",
+        "_offset_dates",
+        "_add_dates",
+        "_remove_dates",
+        "_due_dates",
+        "_next_due_date",
+        "_last_updated",
+        "last_completed",
+        "_days",
+        "_overdue",
+        "_overdue_days",
+        "_frequency",
+        "_user",
+        "_attrs_cache",
+        "_start_date",
+    )
+
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize Chore class."""
         config = config_entry.options
@@ -45,8 +78,7 @@ class Chore(RestoreEntity):
 
     def _get_month(self, month_name: str) -> int:
         """Get the integer value of the month from its name."""
-        months = [m["value"] for m in const.MONTH_OPTIONS]
-        return months.index(month_name) + 1 if month_name in months else 1
+        return _MONTH_INDEX.get(month_name, 1)
 
     def _initialize_icons(self, config: dict[str, Any]) -> None:
         """Initialize icons from configuration."""
@@ -77,9 +109,14 @@ class Chore(RestoreEntity):
         self._attr_state = self._days
         self._attr_icon = self._icon_normal
         self._user: str | None = None
+        # Built on the first read and dropped by update_state, so every
+        # change to a field in extra_state_attributes must go through it
+        self._attrs_cache: dict[str, Any] | None = None
 
     def _get_start_date(self, start_date_str: str | None) -> date | None:
         """Convert string to a date, handle invalid values."""
+        if not start_date_str:
+            return None
         try:
             return helpers.to_date(start_date_str)
         except ValueError:
@@ -89,7 +126,7 @@ class Chore(RestoreEntity):
         """When sensor is added to HA, restore state and add it to calendar."""
         await super().async_added_to_hass()
         await self._restore_state()
-        await self._add_to_calendar()
+        self._add_to_calendar()
 
     async def async_will_remove_from_hass(self) -> None:
         """When sensor is removed from HA, remove it and its calendar entity."""
@@ -99,13 +136,13 @@ class Chore(RestoreEntity):
 
     async def _restore_state(self) -> None:
         """Restore state from the last known state."""
-        state = await self.async_get_last_state()  # Await the coroutine
+        state = await self.async_get_last_state()
         if not state:
             return
         self._attr_state = state.state
         self._last_updated = None  # Unblock update after options change
         self._days = state.attributes.get(const.ATTR_DAYS)
-        self._next_due_date = helpers.parse_optional_datetime(state.attributes, const.ATTR_NEXT_DATE)
+        self._next_due_date = helpers.parse_optional_date(state.attributes, const.ATTR_NEXT_DATE)
         self.last_completed = helpers.parse_optional_datetime(state.attributes, const.ATTR_LAST_COMPLETED)
         self._overdue = state.attributes.get(const.ATTR_OVERDUE, False)
         self._overdue_days = state.attributes.get(const.ATTR_OVERDUE_DAYS)
@@ -113,26 +150,22 @@ class Chore(RestoreEntity):
         self._add_dates = state.attributes.get(const.ATTR_ADD_DATES, "")
         self._remove_dates = state.attributes.get(const.ATTR_REMOVE_DATES, "")
 
-    async def _add_to_calendar(self) -> None:
+    def _add_to_calendar(self) -> None:
         """Add the chore to the calendar platform."""
         if not self.hidden:
-            await self._create_calendar_if_needed()
             self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM].add_entity(self.entity_id)
 
-    async def _remove_from_calendar(self) -> None:
+    def _remove_from_calendar(self) -> None:
         """Remove the chore from the calendar platform."""
-        self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM].remove_entity(self.entity_id)
-
-    async def _create_calendar_if_needed(self) -> None:
-        """Create a calendar if not already present."""
-        if const.CALENDAR_PLATFORM not in self.hass.data[const.DOMAIN]:
-            self.hass.data[const.DOMAIN][const.CALENDAR_PLATFORM] = EntitiesCalendarData(self.hass)
-            LOGGER.debug("Creating chore calendar")
-            await self.hass.config_entries.async_forward_entry_setups(self.config_entry, PLATFORMS)
+        calendar = self.hass.data.get(const.DOMAIN, {}).get(const.CALENDAR_PLATFORM)
+        if calendar is not None:
+            calendar.remove_entity(self.entity_id)
 
     def _remove_from_registry(self) -> None:
         """Remove the entity from the platform registry."""
-        del self.hass.data[const.DOMAIN][const.SENSOR_PLATFORM][self.entity_id]
+        self.hass.data.get(const.DOMAIN, {}).get(const.SENSOR_PLATFORM, {}).pop(
+            self.entity_id, None
+        )
 
     @property
     def name(self) -> str | None:
@@ -207,7 +240,9 @@ class Chore(RestoreEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        return {
+        if self._attrs_cache is not None:
+            return self._attrs_cache
+        attributes = {
             const.ATTR_LAST_COMPLETED: self.last_completed,
             const.ATTR_LAST_UPDATED: self.last_updated,
             const.ATTR_OVERDUE: self.overdue,
@@ -220,27 +255,48 @@ class Chore(RestoreEntity):
             ATTR_DEVICE_CLASS: const.DEVICE_CLASS_CHORE,
             ATTR_HIDDEN: self.hidden,
         }
+        # Unset values only add noise to the serialized state
+        self._attrs_cache = {
+            key: value for key, value in attributes.items() if value is not None
+        }
+        return self._attrs_cache
 
-    def update_state(self) -> None:
-        """Force a state update."""
+    def update_state(self, now: datetime | None = None) -> None:
+        """Force a state update.
+
+        This is the only place the cached state attributes are dropped, so
+        any change to the chore's fields must be followed by a call to it.
+        Callers updating many chores at once can pass a shared ``now``.
+        """
+        self._attrs_cache = None
         self.async_write_ha_state()
-        self._last_updated = datetime.now()
+        self._last_updated = now or helpers.now()
+        # The write above cached the previous last_updated
+        self._attrs_cache = None
 
-    def set_chore_completed(self, completed_at: datetime | None = None) -> None:
+    def set_chore_completed(
+        self, completed_at: datetime | None = None, now: datetime | None = None
+    ) -> None:
         """Mark the chore as completed."""
-        self.last_completed = completed_at or datetime.now()
-        LOGGER.debug("Chore '%s' completed at %s", self._attr_name, self.last_completed)
-        self.update_state()
-
-    def mark_overdue(self, overdue: bool, overdue_days: int) -> None:
+        now = now or helpers.now()
+        self.last_completed = completed_at or now
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Chore '%s' completed at %s", self._attr_name, self.last_completed)
+        self.update_state(now)
+
+    def mark_overdue(
+        self, overdue: bool, overdue_days: int, now: datetime | None = None
+    ) -> None:
         """Mark the chore as overdue."""
         self._overdue = overdue
         self._overdue_days = overdue_days
-        LOGGER.debug("Chore '%s' marked as overdue (%d days)", self._attr_name, self._overdue_days)
-        self.update_state()
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Chore '%s' marked as overdue (%d days)", self._attr_name, self._overdue_days)
+        self.update_state(now)
 
     def calculate_next_due_date(self) -> None:
         """Calculate and update the next due date."""
         self._next_due_date = helpers.calculate_next_due_date(self._frequency, self.last_completed)
-        LOGGER.debug("Next due date for '%s' calculated: %s", self._attr_name, self._next_due_date)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Next due date for '%s' calculated: %s", self._attr_name, self._next_due_date)
         self.update_state()
@@ -2,202 +2,325 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
 from .const import DOMAIN
 from homeassistant import config_entries
-from homeassistant.const import ATTR_HIDDEN, CONF_NAME
+from homeassistant.const import (
+    ATTR_HIDDEN,
+    CONF_NAME,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.schema_config_entry_flow import (
-    SchemaConfigFlowHandler,
+    SchemaCommonFlowHandler,
     SchemaFlowError,
     SchemaFlowFormStep,
     SchemaFlowMenuStep,
 )
 from . import const, helpers
 
-async def get_person_entities(hass) -> dict[str, str]:
-    """Return a dictionary of valid person entity IDs and their names."""
-    persons = hass.states.async_all('person')  # Fetch all entities in the 'person' domain
-    return {person.entity_id: person.name for person in persons}
+_BLANK_FREQUENCIES = frozenset(const.BLANK_FREQUENCY)
+_WEEKLY_FREQUENCIES = frozenset(const.WEEKLY_FREQUENCY)
+_MONTHLY_FREQUENCIES = frozenset(const.MONTHLY_FREQUENCY)
+_YEARLY_FREQUENCIES = frozenset(const.YEARLY_FREQUENCY)
+_WEEKLY_OR_MONTHLY_FREQUENCIES = _WEEKLY_FREQUENCIES | _MONTHLY_FREQUENCIES
+_PERIODIC_FREQUENCIES = (
+    frozenset(const.DAILY_FREQUENCY) | _WEEKLY_OR_MONTHLY_FREQUENCIES | _YEARLY_FREQUENCIES
+)
+
+# Built vol.Schema objects, keyed by step, select options and stored options
+_SCHEMA_CACHE_SIZE = 32
+_SCHEMA_CACHE: OrderedDict[tuple, vol.Schema] = OrderedDict()
+
+_BLANK_DATE_VALUES = frozenset({"0", "0/0", ""})
+
+_UOM_BY_FREQUENCY = {
+    "every-n-days": "day(s)",
+    "every-n-weeks": "week(s)",
+    "every-n-months": "month(s)",
+    "every-n-years": "year(s)",
+    "after-n-days": "day(s)",
+    "after-n-weeks": "week(s)",
+    "after-n-months": "month(s)",
+    "after-n-years": "year(s)",
+}
+
+# One period selector per unit, shared by the every-n and after-n frequencies
+_PERIOD_SELECTORS = {
+    unit: selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=1,
+            max=1000,
+            mode=selector.NumberSelectorMode.BOX,
+            unit_of_measurement=unit,
+        )
+    )
+    for unit in set(_UOM_BY_FREQUENCY.values())
+}
+
+# Selectors of the detail step that only depend on constants
+_TEXT_SELECTOR = selector.TextSelector()
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+_DATE_SELECTOR = selector.DateSelector()
+_DAY_OF_MONTH_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=31,
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+_WEEKDAY_ORDER_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=const.ORDER_OPTIONS,
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+_DUE_DATE_OFFSET_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=-7,
+        max=7,
+        mode=selector.NumberSelectorMode.SLIDER,
+        unit_of_measurement="day(s)",
+    )
+)
+_CHORE_DAY_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=const.WEEKDAY_OPTIONS,
+    )
+)
+_FIRST_WEEK_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=1,
+        max=52,
+        mode=selector.NumberSelectorMode.BOX,
+        unit_of_measurement="weeks",
+    )
+)
+_MONTH_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=const.MONTH_OPTIONS)
+)
+
+# Selectors of the general step that only depend on constants
+_FREQUENCY_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=const.FREQUENCY_OPTIONS)
+)
+_ICON_SELECTOR = selector.IconSelector()
+_FORECAST_DATES_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=100,
+        mode=selector.NumberSelectorMode.BOX,
+        step=1,
+    )
+)
+
+# flow_state key for the person options of the current flow
+_PERSON_OPTIONS = "person_options"
+
+@lru_cache(maxsize=8)
+def _select_selector(options: tuple[tuple[str, str], ...]) -> selector.SelectSelector:
+    """Return a SelectSelector for (value, label) pairs, reused while they are unchanged."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=[
+                selector.SelectOptionDict(value=value, label=label)
+                for value, label in options
+            ]
+        )
+    )
+
+def _options_key(options: list[selector.SelectOptionDict]) -> tuple[tuple[str, str], ...]:
+    """Return a hashable key for a list of select options."""
+    return tuple((option["value"], option["label"]) for option in options)
+
+async def get_person_entities(
+    handler: SchemaCommonFlowHandler,
+) -> list[selector.SelectOptionDict]:
+    """Return select options for the available person entities."""
+    # Memoized for the lifetime of the flow, so each step reuses the same list
+    if (cached := handler.flow_state.get(_PERSON_OPTIONS)) is not None:
+        return cached
+    states = handler.parent_handler.hass.states
+    persons = []
+    for entity_id in states.async_entity_ids('person'):
+        person = states.get(entity_id)
+        if person is None or person.state == STATE_UNAVAILABLE:
+            continue
+        persons.append(selector.SelectOptionDict(value=entity_id, label=person.name))
+    handler.flow_state[_PERSON_OPTIONS] = persons
+    return persons
 
 async def _validate_config(
-    _: SchemaConfigFlowHandler, data: Any
+    _: SchemaCommonFlowHandler, data: Any
 ) -> Any:
     """Validate config."""
     # Validate various configuration options
-    if const.CONF_DAY_OF_MONTH in data and data[const.CONF_DAY_OF_MONTH] < 1:
+    day_of_month = data.get(const.CONF_DAY_OF_MONTH)
+    if day_of_month is not None and day_of_month < 1:
         data[const.CONF_DAY_OF_MONTH] = None
 
-    if const.CONF_DATE in data:
-        if data[const.CONF_DATE] in {"0", "0/0", ""}:
+    month_day = data.get(const.CONF_DATE)
+    if month_day is not None:
+        if month_day in _BLANK_DATE_VALUES:
             data[const.CONF_DATE] = None
         else:
             try:
-                helpers.month_day_text(data[const.CONF_DATE])
+                helpers.month_day_text(month_day)
             except vol.Invalid as exc:
                 raise SchemaFlowError("month_day") from exc
 
-    if const.CONF_WEEKDAY_ORDER_NUMBER in data and int(data[const.CONF_WEEKDAY_ORDER_NUMBER]) == 0:
+    # Both come from select options where "0" stands for "None"
+    if data.get(const.CONF_WEEKDAY_ORDER_NUMBER) in ("0", 0):
         data[const.CONF_WEEKDAY_ORDER_NUMBER] = None
 
-    if const.CONF_CHORE_DAY in data and data[const.CONF_CHORE_DAY] == "0":
+    if data.get(const.CONF_CHORE_DAY) in ("0", 0):
         data[const.CONF_CHORE_DAY] = None
 
-    if const.CONF_USER in data:
-        user_id = data[const.CONF_USER]
-        # Additional validation can be added here if necessary
-        data[const.CONF_USER] = user_id  # Store the user ID
-
     return data
 
+@lru_cache(maxsize=256, typed=True)
+def _cached_marker(
+    marker: type[vol.Marker], key: str, suggested_value: Any
+) -> vol.Marker:
+    """Return a shared marker; they are never mutated once built."""
+    if suggested_value is None:
+        return marker(key)
+    return marker(key, description={"suggested_value": suggested_value})
+
+def _marker(marker: type[vol.Marker], key: str, suggested_value: Any) -> vol.Marker:
+    """Return a marker with the suggested value, reusing cached ones."""
+    try:
+        return _cached_marker(marker, key, suggested_value)
+    except TypeError:  # Unhashable suggested value
+        return marker(key, description={"suggested_value": suggested_value})
+
 def required(key: str, options: dict[str, Any], default: Any | None = None) -> vol.Required:
     """Return vol.Required."""
-    suggested_value = options.get(key, default)
-    return vol.Required(key, description={"suggested_value": suggested_value})
+    return _marker(vol.Required, key, options.get(key, default))
 
 def optional(key: str, options: dict[str, Any], default: Any | None = None) -> vol.Optional:
     """Return vol.Optional."""
-    suggested_value = options.get(key, default)
-    return vol.Optional(key, description={"suggested_value": suggested_value})
+    return _marker(vol.Optional, key, options.get(key, default))
+
+def _schema_key(options: Mapping[str, Any], *parts: Any) -> tuple | None:
+    """Return a cache key for a schema, or None if the options are unhashable."""
+    key = (
+        *parts,
+        tuple(sorted((name, type(value), value) for name, value in options.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+def _cached_schema(key: tuple | None) -> vol.Schema | None:
+    """Return a previously built schema for key."""
+    if key is None or key not in _SCHEMA_CACHE:
+        return None
+    _SCHEMA_CACHE.move_to_end(key)
+    return _SCHEMA_CACHE[key]
+
+def _cache_schema(key: tuple | None, schema: vol.Schema) -> vol.Schema:
+    """Store a built schema, evicting the least recently used one."""
+    if key is not None:
+        _SCHEMA_CACHE[key] = schema
+        if len(_SCHEMA_CACHE) > _SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.popitem(last=False)
+    return schema
 
-async def general_schema_definition(
-    handler: SchemaConfigFlowHandler,
+def general_schema_definition(
+    handler: SchemaCommonFlowHandler,
+    person_options: tuple[tuple[str, str], ...],
 ) -> dict[vol.Required | vol.Optional, Any]:
     """Create general schema."""
-    person_entities = await get_person_entities(handler.hass)
-
     schema = {
-        required(const.CONF_FREQUENCY, handler.options, const.DEFAULT_FREQUENCY): selector.SelectSelector(
-            selector.SelectSelectorConfig(options=const.FREQUENCY_OPTIONS)
-        ),
-        optional(const.CONF_ICON_NORMAL, handler.options, const.DEFAULT_ICON_NORMAL): selector.IconSelector(),
-        optional(const.CONF_ICON_TOMORROW, handler.options, const.DEFAULT_ICON_TOMORROW): selector.IconSelector(),
-        optional(const.CONF_ICON_TODAY, handler.options, const.DEFAULT_ICON_TODAY): selector.IconSelector(),
-        optional(const.CONF_ICON_OVERDUE, handler.options, const.DEFAULT_ICON_OVERDUE): selector.IconSelector(),
-        optional(const.CONF_FORECAST_DATES, handler.options, const.DEFAULT_FORECAST_DATES): selector.NumberSelector(
-            selector.NumberSelectorConfig(
-                min=0,
-                max=100,
-                mode=selector.NumberSelectorMode.BOX,
-                step=1,
-            )
-        ),
+        required(const.CONF_FREQUENCY, handler.options, const.DEFAULT_FREQUENCY): _FREQUENCY_SELECTOR,
+        optional(const.CONF_ICON_NORMAL, handler.options, const.DEFAULT_ICON_NORMAL): _ICON_SELECTOR,
+        optional(const.CONF_ICON_TOMORROW, handler.options, const.DEFAULT_ICON_TOMORROW): _ICON_SELECTOR,
+        optional(const.CONF_ICON_TODAY, handler.options, const.DEFAULT_ICON_TODAY): _ICON_SELECTOR,
+        optional(const.CONF_ICON_OVERDUE, handler.options, const.DEFAULT_ICON_OVERDUE): _ICON_SELECTOR,
+        optional(const.CONF_FORECAST_DATES, handler.options, const.DEFAULT_FORECAST_DATES): _FORECAST_DATES_SELECTOR,
         optional(ATTR_HIDDEN, handler.options, False): bool,
         optional(const.CONF_MANUAL, handler.options, False): bool,
         optional(const.CONF_SHOW_OVERDUE_TODAY, handler.options, const.DEFAULT_SHOW_OVERDUE_TODAY): bool,
-        optional(const.CONF_PERSON, handler.options): selector.SelectSelector(
-            selector.SelectSelectorConfig(options=person_entities)
-        ),
+        optional(const.CONF_PERSON, handler.options): _select_selector(person_options),
     }
 
     return schema
 
 async def general_config_schema(
-    handler: SchemaConfigFlowHandler,
+    handler: SchemaCommonFlowHandler,
 ) -> vol.Schema:
     """Generate config schema."""
-    schema_obj = {required(CONF_NAME, handler.options): selector.TextSelector()}
-    schema_obj.update(await general_schema_definition(handler))
-    return vol.Schema(schema_obj)
+    person_options = _options_key(await get_person_entities(handler))
+    cache_key = _schema_key(handler.options, "user", person_options)
+    if (schema := _cached_schema(cache_key)) is not None:
+        return schema
+    schema_obj = {required(CONF_NAME, handler.options): _TEXT_SELECTOR}
+    schema_obj.update(general_schema_definition(handler, person_options))
+    return _cache_schema(cache_key, vol.Schema(schema_obj))
 
 async def general_options_schema(
-    handler: SchemaConfigFlowHandler,
+    handler: SchemaCommonFlowHandler,
 ) -> vol.Schema:
     """Generate options schema."""
-    return vol.Schema(await general_schema_definition(handler))
+    person_options = _options_key(await get_person_entities(handler))
+    cache_key = _schema_key(handler.options, "init", person_options)
+    if (schema := _cached_schema(cache_key)) is not None:
+        return schema
+    return _cache_schema(
+        cache_key, vol.Schema(general_schema_definition(handler, person_options))
+    )
 
 async def detail_config_schema(
-    handler: SchemaConfigFlowHandler,
+    handler: SchemaCommonFlowHandler,
 ) -> vol.Schema:
     """Generate options schema."""
-    options_schema = {}
     frequency = handler.options.get(const.CONF_FREQUENCY)
+    if frequency in _BLANK_FREQUENCIES:
+        return vol.Schema({})
+
+    # The default is only used when no start date has been stored yet
+    start_date_default = (
+        None if const.CONF_START_DATE in handler.options else helpers.now().date()
+    )
+    cache_key = _schema_key(handler.options, "detail", start_date_default)
+    if (schema := _cached_schema(cache_key)) is not None:
+        return schema
+
+    options_schema = {}
+    if frequency in _PERIODIC_FREQUENCIES:
+        options_schema[required(const.CONF_PERIOD, handler.options)] = _PERIOD_SELECTORS[_UOM_BY_FREQUENCY[frequency]]
+
+    if frequency in _YEARLY_FREQUENCIES:
+        options_schema[optional(const.CONF_DATE, handler.options)] = _TEXT_SELECTOR
+
+    if frequency in _MONTHLY_FREQUENCIES:
+        options_schema[optional(const.CONF_DAY_OF_MONTH, handler.options)] = _DAY_OF_MONTH_SELECTOR
+        options_schema[optional(const.CONF_WEEKDAY_ORDER_NUMBER, handler.options)] = _WEEKDAY_ORDER_SELECTOR
+        options_schema[optional(const.CONF_FORCE_WEEK_NUMBERS, handler.options)] = _BOOLEAN_SELECTOR
+        options_schema[optional(const.CONF_DUE_DATE_OFFSET, handler.options)] = _DUE_DATE_OFFSET_SELECTOR
+
+    if frequency in _WEEKLY_OR_MONTHLY_FREQUENCIES:
+        options_schema[optional(const.CONF_CHORE_DAY, handler.options)] = _CHORE_DAY_SELECTOR
 
-    if frequency not in const.BLANK_FREQUENCY:
-        if frequency in (
-            const.DAILY_FREQUENCY +
-            const.WEEKLY_FREQUENCY +
-            const.MONTHLY_FREQUENCY +
-            const.YEARLY_FREQUENCY
-        ):
-            uom = {
-                "every-n-days": "day(s)",
-                "every-n-weeks": "week(s)",
-                "every-n-months": "month(s)",
-                "every-n-years": "year(s)",
-                "after-n-days": "day(s)",
-                "after-n-weeks": "week(s)",
-                "after-n-months": "month(s)",
-                "after-n-years": "year(s)",
-            }
-            options_schema[required(const.CONF_PERIOD, handler.options)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=1,
-                    max=1000,
-                    mode=selector.NumberSelectorMode.BOX,
-                    unit_of_measurement=uom[frequency],
-                )
-            )
-
-        if frequency in const.YEARLY_FREQUENCY:
-            options_schema[optional(const.CONF_DATE, handler.options)] = selector.TextSelector()
-
-        if frequency in const.MONTHLY_FREQUENCY:
-            options_schema[optional(const.CONF_DAY_OF_MONTH, handler.options)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=1,
-                    max=31,
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            )
-            options_schema[optional(const.CONF_WEEKDAY_ORDER_NUMBER, handler.options)] = selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=const.ORDER_OPTIONS,
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            )
-            options_schema[optional(const.CONF_FORCE_WEEK_NUMBERS, handler.options)] = selector.BooleanSelector()
-            options_schema[optional(const.CONF_DUE_DATE_OFFSET, handler.options)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=-7,
-                    max=7,
-                    mode=selector.NumberSelectorMode.SLIDER,
-                    unit_of_measurement="day(s)",
-                )
-            )
-
-        if frequency in (const.WEEKLY_FREQUENCY + const.MONTHLY_FREQUENCY):
-            options_schema[optional(const.CONF_CHORE_DAY, handler.options)] = selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=const.WEEKDAY_OPTIONS,
-                )
-            )
-
-        if frequency in const.WEEKLY_FREQUENCY:
-            options_schema[required(const.CONF_FIRST_WEEK, handler.options, const.DEFAULT_FIRST_WEEK)] = selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=1,
-                    max=52,
-                    mode=selector.NumberSelectorMode.BOX,
-                    unit_of_measurement="weeks",
-                )
-            )
-
-        if frequency not in const.YEARLY_FREQUENCY:
-            options_schema[optional(const.CONF_FIRST_MONTH, handler.options, const.DEFAULT_FIRST_MONTH)] = selector.SelectSelector(
-                selector.SelectSelectorConfig(options=const.MONTH_OPTIONS)
-            )
-            options_schema[optional(const.CONF_LAST_MONTH, handler.options, const.DEFAULT_LAST_MONTH)] = selector.SelectSelector(
-                selector.SelectSelectorConfig(options=const.MONTH_OPTIONS)
-            )
-
-        options_schema[required(const.CONF_START_DATE, handler.options, helpers.now().date())] = selector.DateSelector()
-
-    return vol.Schema(options_schema)
+    if frequency in _WEEKLY_FREQUENCIES:
+        options_schema[required(const.CONF_FIRST_WEEK, handler.options, const.DEFAULT_FIRST_WEEK)] = _FIRST_WEEK_SELECTOR
+
+    if frequency not in _YEARLY_FREQUENCIES:
+        options_schema[optional(const.CONF_FIRST_MONTH, handler.options, const.DEFAULT_FIRST_MONTH)] = _MONTH_SELECTOR
+        options_schema[optional(const.CONF_LAST_MONTH, handler.options, const.DEFAULT_LAST_MONTH)] = _MONTH_SELECTOR
+
+    options_schema[required(const.CONF_START_DATE, handler.options, start_date_default)] = _DATE_SELECTOR
+
+    return _cache_schema(cache_key, vol.Schema(options_schema))
 
 async def choose_details_step(_: dict[str, Any]) -> str:
     """Return next step_id for options flow."""
@@ -217,6 +340,11 @@ OPTIONS_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
     ),
 }
 
+@lru_cache(maxsize=64)
+def _format_title(name: str, user: str) -> str:
+    """Return the config entry title for a chore name and assigned user."""
+    return f"{name} (Assigned to {user})"
+
 class ChoreHelperConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config or options flow for Chore Helper."""
 
@@ -235,6 +363,6 @@ class ChoreHelperConfigFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     @callback
     def async_config_entry_title(self, options: Mapping[str, Any]) -> str:
         """Return config entry title."""
-        title = options.get(CONF_NAME, "")
-        user = options.get(const.CONF_USER, "Unknown user")
-        return f"{title} (Assigned to {user})"
+        return _format_title(
+            options.get(CONF_NAME, ""), options.get(const.CONF_USER, "Unknown user")
+        )
@@ -3,13 +3,16 @@
 # Borrowed from Garbage Collection integration.
 from __future__ import annotations
 
+from calendar import monthrange
+import contextlib
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any
 import logging
+import re
 
 import homeassistant.util.dt as dt_util
 import voluptuous as vol
-from dateutil.parser import ParserError, parse
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,39 +20,83 @@ def now() -> datetime:
     """Return current date and time. Needed for testing."""
     return dt_util.now()
 
+@lru_cache(maxsize=1024)
+def _date_from_iso(text: str) -> date:
+    """Parse an ISO date, memoized as the same dates recur on every update."""
+    return date.fromisoformat(text)
+
 def to_date(day: Any) -> date:
-    """Convert datetime or text to date, if not already datetime."""
+    """Convert datetime or text to date, if not already date."""
+    day_type = type(day)
+    if day_type is date:
+        return day
+    if day_type is datetime:
+        return day.date()
     if day is None:
         raise ValueError
-    if isinstance(day, date):
-        return day
+    # datetime is a subclass of date, so it has to be checked first
     if isinstance(day, datetime):
         return day.date()
-    return date.fromisoformat(day)
+    if isinstance(day, date):
+        return day
+    return _date_from_iso(day)
+
+@lru_cache(maxsize=512)
+def _datetime_from_iso(text: str) -> datetime:
+    """Parse an ISO datetime, memoized as the same values recur on every update."""
+    return datetime.fromisoformat(text)
 
 def parse_datetime(text: str) -> datetime | None:
     """Parse text to datetime object."""
+    if not isinstance(text, str):
+        return None
+    with contextlib.suppress(ValueError):
+        return _datetime_from_iso(text)
+    # dateutil fills missing fields from the current date, so it is not
+    # memoized; its parser is costly to import and only needed for non-ISO text
+    from dateutil.parser import ParserError, parse  # pylint: disable=import-outside-toplevel
+
     try:
         return parse(text)
-    except (ParserError, TypeError):
+    except ParserError:
         return None
 
 def dates_to_texts(dates: list[date]) -> list[str]:
     """Convert list of dates to texts."""
-    converted: list[str] = []
-    for record in dates:
-        try:
-            converted.append(record.isoformat())
-        except ValueError:
-            continue
-    return converted
+    return [record.isoformat() for record in dates]
+
+# The same patterns strptime uses for "%H:%M" and "%m/%d"
+_TIME_RE = re.compile(r"(2[0-3]|[0-1]\d|\d):([0-5]\d|\d)")
+_MONTH_DAY_RE = re.compile(r"(1[0-2]|0[1-9]|[1-9])/(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])")
+
+@lru_cache(maxsize=256)
+def _time_text(value: str) -> str:
+    """Normalize HH:MM text, without the cost of strptime."""
+    match = _TIME_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(value)
+    return f"{int(match[1]):02d}:{int(match[2]):02d}"
+
+@lru_cache(maxsize=256)
+def _month_day_text(value: str) -> str:
+    """Normalize mm/dd text, without the cost of strptime."""
+    match = _MONTH_DAY_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(value)
+    month, day = int(match[1]), int(match[2])
+    # Same rules as strptime, which validates against the non-leap year 1900
+    if day > monthrange(1900, month)[1]:
+        raise ValueError(value)
+    return f"{month:02d}/{day:02d}"
 
 def time_text(value: Any) -> str:
     """Have to store time as text - datetime is not JSON serializable."""
     if value is None or value == "":
         return ""
+    if not isinstance(value, str):
+        raise vol.Invalid(f"Invalid date: {value}")
     try:
-        return datetime.strptime(value, "%H:%M").time().strftime("%H:%M")
+        return _time_text(value)
     except ValueError as error:
         raise vol.Invalid(f"Invalid date: {value}") from error
 
@@ -57,17 +104,39 @@ def month_day_text(value: Any) -> str:
     """Validate format month/day."""
     if value is None or value == "":
         return ""
+    if not isinstance(value, str):
+        raise vol.Invalid(f"Invalid date: {value}")
     try:
-        return datetime.strptime(value, "%m/%d").date().strftime("%m/%d")
+        return _month_day_text(value)
     except ValueError as error:
         raise vol.Invalid(f"Invalid date: {value}") from error
 
 def parse_optional_datetime(attributes: dict[str, Any], key: str) -> datetime | None:
     """Parse an optional date from the attributes dictionary."""
     date_str = attributes.get(key)
-    if date_str:
-        try:
-            return datetime.fromisoformat(date_str)
-        except ValueError as e:
-            _LOGGER.error(f"Error parsing date '{date_str}' from key '{key}': {e}")
-    return None
+    if isinstance(date_str, datetime):
+        return date_str
+    if not date_str:
+        return None
+    parsed = parse_datetime(date_str)
+    if parsed is None:
+        _LOGGER.error("Error parsing date %r from key %r", date_str, key)
+    return parsed
+
+def parse_optional_date(attributes: dict[str, Any], key: str) -> date | None:
+    """Parse an optional date from the attributes dictionary."""
+    value = attributes.get(key)
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        with contextlib.suppress(ValueError):
+            return date.fromisoformat(value)
+    parsed = parse_datetime(value)
+    if parsed is None:
+        _LOGGER.error("Error parsing date %r from key %r", value, key)
+        return None
+    return parsed.date()
@@ -0,0 +1,53 @@
+"""Test the Chore Helper chore entity."""
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.chore_helper import const
+from custom_components.chore_helper.chore_daily import DailyChore
+
+
+def _daily_chore() -> DailyChore:
+    """Return a chore that is not added to Home Assistant."""
+    entry = MockConfigEntry(
+        domain=const.DOMAIN,
+        title="Dishes",
+        options={const.CONF_FREQUENCY: "every-n-days", const.CONF_PERIOD: 1},
+    )
+    return DailyChore(entry)
+
+
+def test_update_state_refreshes_cached_attributes() -> None:
+    """Test writes after update_state publish the current last_updated."""
+    chore = _daily_chore()
+    published = []
+
+    def write_state(self: DailyChore) -> None:
+        published.append(self.extra_state_attributes.get(const.ATTR_LAST_UPDATED))
+
+    first = datetime(2024, 3, 1, 0, 0, tzinfo=timezone.utc)
+    second = datetime(2024, 3, 1, 0, 1, tzinfo=timezone.utc)
+    with patch.object(DailyChore, "async_write_ha_state", write_state):
+        chore.update_state(first)
+        chore.async_write_ha_state()
+        chore.update_state(second)
+        chore.async_write_ha_state()
+
+    assert published == [None, first, first, second]
+    assert chore.extra_state_attributes[const.ATTR_LAST_UPDATED] == second
+
+
+def test_mutations_reach_cached_attributes() -> None:
+    """Test field changes made through update_state are published."""
+    chore = _daily_chore()
+    completed = datetime(2024, 3, 1, 8, 0, tzinfo=timezone.utc)
+    with patch.object(DailyChore, "async_write_ha_state"):
+        assert const.ATTR_LAST_COMPLETED not in chore.extra_state_attributes
+        chore.set_chore_completed(completed, now=completed)
+        chore.mark_overdue(True, 2, now=completed)
+
+    attributes = chore.extra_state_attributes
+    assert attributes[const.ATTR_LAST_COMPLETED] == completed
+    assert attributes[const.ATTR_OVERDUE] is True
+    assert attributes[const.ATTR_OVERDUE_DAYS] == 2
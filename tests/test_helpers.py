@@ -0,0 +1,195 @@
+"""Test the Chore Helper date and text helpers."""
+from datetime import date, datetime, timezone
+
+from freezegun import freeze_time
+import pytest
+import voluptuous as vol
+
+from custom_components.chore_helper import helpers
+
+
+def _strptime_text(value: str, fmt: str) -> str | None:
+    """Return what the previous strptime based implementation produced."""
+    try:
+        return datetime.strptime(value, fmt).strftime(fmt)
+    except ValueError:
+        return None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "01/05",
+        "1/5",
+        "1/05",
+        "01/5",
+        "1/ 5",
+        "12/31",
+        "02/28",
+        "02/29",
+        "04/30",
+        "04/31",
+        "13/01",
+        "00/10",
+        "01/00",
+        "01/32",
+        "01/1٥",
+        "１/05",
+        " 1/05",
+        "01/05 ",
+        "001/05",
+        "01-05",
+        "0105",
+        "/",
+        "abc",
+    ],
+)
+def test_month_day_text_matches_strptime(value: str) -> None:
+    """Test month_day_text accepts and pads exactly what strptime did."""
+    expected = _strptime_text(value, "%m/%d")
+    if expected is None:
+        with pytest.raises(vol.Invalid):
+            helpers.month_day_text(value)
+    else:
+        assert helpers.month_day_text(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "00:00",
+        "0:0",
+        "9:05",
+        "09:5",
+        "23:59",
+        "24:00",
+        "23:60",
+        "1٥:00",
+        " 9:05",
+        "09:05 ",
+        "009:05",
+        "09.05",
+        "0905",
+        ":",
+        "abc",
+    ],
+)
+def test_time_text_matches_strptime(value: str) -> None:
+    """Test time_text accepts and pads exactly what strptime did."""
+    expected = _strptime_text(value, "%H:%M")
+    if expected is None:
+        with pytest.raises(vol.Invalid):
+            helpers.time_text(value)
+    else:
+        assert helpers.time_text(value) == expected
+
+
+@pytest.mark.parametrize("value", [None, ""])
+def test_blank_texts(value) -> None:
+    """Test blank values are stored as empty text."""
+    assert helpers.month_day_text(value) == ""
+    assert helpers.time_text(value) == ""
+
+
+@pytest.mark.parametrize("value", [105, 1.5, ["01/05"], datetime(2024, 1, 5)])
+def test_non_string_texts(value) -> None:
+    """Test values that are not text are rejected."""
+    with pytest.raises(vol.Invalid):
+        helpers.month_day_text(value)
+    with pytest.raises(vol.Invalid):
+        helpers.time_text(value)
+
+
+def test_to_date_passes_dates_through() -> None:
+    """Test a date is returned unchanged."""
+    day = date(2024, 3, 1)
+    assert helpers.to_date(day) is day
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 3, 1, 23, 59),
+        datetime(2024, 3, 1, 0, 0, tzinfo=timezone.utc),
+    ],
+)
+def test_to_date_from_datetime(value: datetime) -> None:
+    """Test a datetime, which is also a date, is reduced to its date."""
+    result = helpers.to_date(value)
+    assert type(result) is date
+    assert result == date(2024, 3, 1)
+
+
+def test_to_date_from_text() -> None:
+    """Test ISO text is parsed to a date."""
+    assert helpers.to_date("2024-03-01") == date(2024, 3, 1)
+
+
+@pytest.mark.parametrize("value", [None, "", "2024-02-30", "not a date"])
+def test_to_date_invalid(value) -> None:
+    """Test missing or invalid values raise ValueError."""
+    with pytest.raises(ValueError):
+        helpers.to_date(value)
+
+
+def test_parse_optional_date_missing() -> None:
+    """Test a missing or empty key gives None."""
+    assert helpers.parse_optional_date({}, "next_due_date") is None
+    assert helpers.parse_optional_date({"next_due_date": None}, "next_due_date") is None
+    assert helpers.parse_optional_date({"next_due_date": ""}, "next_due_date") is None
+
+
+def test_parse_optional_date_from_text() -> None:
+    """Test ISO date text is parsed to a date, not a datetime."""
+    result = helpers.parse_optional_date({"next_due_date": "2024-03-01"}, "next_due_date")
+    assert type(result) is date
+    assert result == date(2024, 3, 1)
+
+
+def test_parse_optional_date_from_objects() -> None:
+    """Test date and datetime values are returned as dates."""
+    day = date(2024, 3, 1)
+    assert helpers.parse_optional_date({"next_due_date": day}, "next_due_date") is day
+    result = helpers.parse_optional_date(
+        {"next_due_date": datetime(2024, 3, 1, 12, 30)}, "next_due_date"
+    )
+    assert type(result) is date
+    assert result == day
+
+
+@pytest.mark.parametrize("value", ["2024-03-01T12:30:00", "March 1, 2024"])
+def test_parse_optional_date_fallback(value: str) -> None:
+    """Test text that is not an ISO date falls back to datetime parsing."""
+    result = helpers.parse_optional_date({"next_due_date": value}, "next_due_date")
+    assert type(result) is date
+    assert result == date(2024, 3, 1)
+
+
+def test_parse_optional_date_invalid(caplog: pytest.LogCaptureFixture) -> None:
+    """Test unparsable values give None and are logged."""
+    assert helpers.parse_optional_date({"next_due_date": "garbage"}, "next_due_date") is None
+    assert "Error parsing date" in caplog.text
+
+
+def test_parse_optional_datetime() -> None:
+    """Test restored datetimes are parsed, and missing ones give None."""
+    moment = datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+    attributes = {"last_completed": moment.isoformat(), "empty": ""}
+    assert helpers.parse_optional_datetime(attributes, "last_completed") == moment
+    assert helpers.parse_optional_datetime({"last_completed": moment}, "last_completed") is moment
+    assert helpers.parse_optional_datetime(attributes, "empty") is None
+    assert helpers.parse_optional_datetime(attributes, "missing") is None
+
+
+def test_parse_optional_datetime_invalid(caplog: pytest.LogCaptureFixture) -> None:
+    """Test unparsable values give None and are logged."""
+    assert helpers.parse_optional_datetime({"last_completed": "garbage"}, "last_completed") is None
+    assert "Error parsing date" in caplog.text
+
+
+def test_parse_datetime_fallback_follows_the_date() -> None:
+    """Test text without a date is not cached past the day it was parsed."""
+    with freeze_time("2024-03-01 08:00:00"):
+        assert helpers.parse_datetime("10:30") == datetime(2024, 3, 1, 10, 30)
+    with freeze_time("2024-03-02 08:00:00"):
+        assert helpers.parse_datetime("10:30") == datetime(2024, 3, 2, 10, 30)